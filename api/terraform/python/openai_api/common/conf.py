@@ -17,23 +17,33 @@ import importlib.util
 import os  # library for interacting with the operating system
 import platform  # library to view information about the server host this Lambda runs on
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import boto3  # AWS SDK for Python https://boto3.amazonaws.com/v1/documentation/api/latest/index.html
+import botocore.session
 from dotenv import load_dotenv
 from openai_api.common.const import IS_USING_TFVARS, PROJECT_ROOT, TFVARS
 from openai_api.common.exceptions import (
     OpenAIAPIConfigurationError,
     OpenAIAPIValueError,
 )
-from pydantic import Field, SecretStr, ValidationError, ValidationInfo, field_validator
-from pydantic_settings import BaseSettings
+from pydantic import (
+    AliasChoices,
+    Field,
+    PrivateAttr,
+    SecretStr,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+)
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 TFVARS = TFVARS or {}
 DOT_ENV_LOADED = load_dotenv()
-ec2 = boto3.Session().client("ec2")
-regions = ec2.describe_regions()
+_OS_NAME, _OS_SYSTEM, _OS_RELEASE = os.name, platform.system(), platform.release()
+_BOTO3_VERSION = boto3.__version__
 
 
 def load_version() -> Dict[str, str]:
@@ -46,8 +56,11 @@ def load_version() -> Dict[str, str]:
 
 
 VERSION = load_version()
+_NEXT_VERSION_RE = re.compile(r"-next\.\d+")
+_NEXT_MAJOR_VERSION_RE = re.compile(r"-next-major\.\d+")
 
 
+@lru_cache(maxsize=1)
 def get_semantic_version() -> str:
     """
     Return the semantic version number.
@@ -67,8 +80,40 @@ def get_semantic_version() -> str:
     - pypi does not allow semantic version numbers to contain a 'next' suffix.
     """
     version = VERSION["__version__"]
-    version = re.sub(r"-next\.\d+", "", version)
-    return re.sub(r"-next-major\.\d+", "", version)
+    version = _NEXT_VERSION_RE.sub("", version)
+    return _NEXT_MAJOR_VERSION_RE.sub("", version)
+
+
+@lru_cache(maxsize=1)
+def _get_valid_regions() -> List[str]:
+    """
+    Return the list of valid AWS regions.
+
+    The list is read from the endpoint data packaged with botocore rather
+    than from ec2.describe_regions(), so that importing this module does not
+    require AWS credentials or a network round trip.
+    """
+    return botocore.session.Session().get_available_regions("ec2")
+
+
+@lru_cache(maxsize=None)
+def _get_session(profile: Optional[str], region: str) -> boto3.Session:
+    """Return a boto3 session, shared by all Settings instances with the same profile and region."""
+    if profile:
+        return boto3.Session(profile_name=profile, region_name=region)
+    return boto3.Session(region_name=region)
+
+
+@lru_cache(maxsize=None)
+def _get_client(service: str, profile: Optional[str], region: str):
+    """Return a boto3 client, created on first use and shared thereafter."""
+    return _get_session(profile, region).client(service)
+
+
+@lru_cache(maxsize=None)
+def _get_resource(service: str, profile: Optional[str], region: str):
+    """Return a boto3 resource, created on first use and shared thereafter."""
+    return _get_session(profile, region).resource(service)
 
 
 # pylint: disable=too-few-public-methods
@@ -95,33 +140,44 @@ class SettingsDefaults:
     PINECONE_API_KEY = SecretStr(None)
     SHARED_RESOURCE_IDENTIFIER = TFVARS.get("shared_resource_identifier", "openai")
     VALID_DOMAIN_PATTERN = r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z0-9][a-z0-9-]{0,61}[a-z0-9]$"
-    VALID_AWS_REGIONS = [region["RegionName"] for region in regions["Regions"]]
 
     @classmethod
+    @lru_cache(maxsize=1)
     def to_dict(cls):
         """Convert SettingsDefaults to dict"""
         return {
             key: value
-            for key, value in SettingsDefaults.__dict__.items()
-            if not key.startswith("__") and not callable(key) and key != "to_dict"
+            for key, value in cls.__dict__.items()
+            if not key.startswith("__") and not callable(value) and key != "to_dict"
         }
 
 
-def empty_str_to_bool_default(v: str, default: bool) -> bool:
-    """Convert empty string to default boolean value"""
-    if v in [None, ""]:
-        return default
-    return v.lower() in ["true", "1", "t", "y", "yes"]
+_VALID_DOMAIN_RE = re.compile(SettingsDefaults.VALID_DOMAIN_PATTERN)
+_TRUTHY = frozenset({"true", "1", "t", "y", "yes"})
+_DEFAULTS_BY_FIELD: Dict[str, Any] = {
+    "aws_profile": SettingsDefaults.AWS_PROFILE,
+    "aws_apigateway_custom_domain_name_create": SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE,
+    "aws_dynamodb_table_id": SettingsDefaults.AWS_DYNAMODB_TABLE_ID,
+    "aws_rekognition_collection_id": SettingsDefaults.AWS_REKOGNITION_COLLECTION_ID,
+    "aws_rekognition_face_detect_attributes": SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_ATTRIBUTES,
+    "aws_rekognition_face_detect_quality_filter": SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_QUALITY_FILTER,
+    "aws_rekognition_face_detect_max_faces_count": SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT,
+    "aws_rekognition_face_detect_threshold": SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_THRESHOLD,
+    "langchain_memory_key": SettingsDefaults.LANGCHAIN_MEMORY_KEY,
+    "openai_api_organization": SettingsDefaults.OPENAI_API_ORGANIZATION,
+    "openai_api_key": SettingsDefaults.OPENAI_API_KEY,
+    "openai_endpoint_image_n": SettingsDefaults.OPENAI_ENDPOINT_IMAGE_N,
+    "openai_endpoint_image_size": SettingsDefaults.OPENAI_ENDPOINT_IMAGE_SIZE,
+    "pinecone_api_key": SettingsDefaults.PINECONE_API_KEY,
+    "shared_resource_identifier": SettingsDefaults.SHARED_RESOURCE_IDENTIFIER,
+}
 
 
-def empty_str_to_int_default(v: str, default: int) -> int:
-    """Convert empty string to default integer value"""
-    if v in [None, ""]:
-        return default
-    try:
-        return int(v)
-    except ValueError:
+def empty_str_to_bool_default(v: str, default: bool) -> bool:
+    """Convert empty string to default boolean value"""
+    if v in (None, ""):
         return default
+    return v.lower() in _TRUTHY
 
 
 # pylint: disable=too-many-public-methods
@@ -129,16 +185,9 @@ def empty_str_to_int_default(v: str, default: int) -> int:
 class Settings(BaseSettings):
     """Settings for Lambda functions"""
 
-    _aws_session: boto3.Session = None
-    _s3_client: boto3.client = None
-    _api_client: boto3.client = None
-    _dynamodb_client: boto3.client = None
-    _rekognition_client: boto3.client = None
-    _dynamodb_table: boto3.resource = None
-    _dump: Dict[str, str] = None
-    _pinecone_api_key_source: str = "unset"
-    _openai_api_key_source: str = "unset"
-    _initialized: bool = False
+    _dump: Dict[str, Any] = PrivateAttr(default=None)
+    _pinecone_api_key_source: str = PrivateAttr(default="unset")
+    _openai_api_key_source: str = PrivateAttr(default="unset")
 
     def __init__(self, **data: Any):
         super().__init__(**data)
@@ -150,88 +199,47 @@ class Settings(BaseSettings):
             self._openai_api_key_source = "environment variable"
         elif data.get("openai_api_key"):
             self._openai_api_key_source = "init argument"
-        self._initialized = True
 
-    debug_mode: Optional[bool] = Field(
-        SettingsDefaults.DEBUG_MODE,
-        env="DEBUG_MODE",
-        pre=True,
-        getter=lambda v: empty_str_to_bool_default(v, SettingsDefaults.DEBUG_MODE),
-    )
-    dump_defaults: Optional[bool] = Field(
-        SettingsDefaults.DUMP_DEFAULTS,
-        env="DUMP_DEFAULTS",
-        pre=True,
-        getter=lambda v: empty_str_to_bool_default(v, SettingsDefaults.DUMP_DEFAULTS),
-    )
-    aws_profile: Optional[str] = Field(
-        SettingsDefaults.AWS_PROFILE,
-        env="AWS_PROFILE",
-    )
-    aws_regions: Optional[List[str]] = Field(SettingsDefaults.VALID_AWS_REGIONS, description="The list of AWS regions")
-    aws_region: Optional[str] = Field(
-        SettingsDefaults.AWS_REGION,
-        env="AWS_REGION",
-    )
+    model_config = SettingsConfigDict(frozen=True)
+
+    debug_mode: Optional[bool] = Field(SettingsDefaults.DEBUG_MODE)
+    dump_defaults: Optional[bool] = Field(SettingsDefaults.DUMP_DEFAULTS)
+    aws_profile: Optional[str] = Field(SettingsDefaults.AWS_PROFILE)
+    aws_region: Optional[str] = Field(SettingsDefaults.AWS_REGION)
     aws_apigateway_custom_domain_name_create: Optional[bool] = Field(
-        SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE,
-        env="AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE",
-        pre=True,
-        getter=lambda v: empty_str_to_bool_default(v, SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE),
+        SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE
     )
     aws_apigateway_root_domain: Optional[str] = Field(
-        SettingsDefaults.AWS_APIGATEWAY_ROOT_DOMAIN_NAME, env="AWS_APIGATEWAY_ROOT_DOMAIN_NAME"
+        SettingsDefaults.AWS_APIGATEWAY_ROOT_DOMAIN_NAME,
+        validation_alias=AliasChoices("aws_apigateway_root_domain", "AWS_APIGATEWAY_ROOT_DOMAIN_NAME"),
     )
     aws_apigateway_custom_domain_name: Optional[str] = Field(
-        "api." + SettingsDefaults.SHARED_RESOURCE_IDENTIFIER + "." + SettingsDefaults.AWS_APIGATEWAY_ROOT_DOMAIN_NAME,
-        env="AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME",
-    )
-    aws_dynamodb_table_id: Optional[str] = Field(
-        SettingsDefaults.AWS_DYNAMODB_TABLE_ID,
-        env="AWS_DYNAMODB_TABLE_ID",
-    )
-    aws_rekognition_collection_id: Optional[str] = Field(
-        SettingsDefaults.AWS_REKOGNITION_COLLECTION_ID,
-        env="AWS_REKOGNITION_COLLECTION_ID",
+        "api." + SettingsDefaults.SHARED_RESOURCE_IDENTIFIER + "." + SettingsDefaults.AWS_APIGATEWAY_ROOT_DOMAIN_NAME
     )
+    aws_dynamodb_table_id: Optional[str] = Field(SettingsDefaults.AWS_DYNAMODB_TABLE_ID)
+    aws_rekognition_collection_id: Optional[str] = Field(SettingsDefaults.AWS_REKOGNITION_COLLECTION_ID)
 
     aws_rekognition_face_detect_attributes: Optional[str] = Field(
-        SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_ATTRIBUTES,
-        env="AWS_REKOGNITION_FACE_DETECT_ATTRIBUTES",
+        SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_ATTRIBUTES
     )
     aws_rekognition_face_detect_quality_filter: Optional[str] = Field(
-        SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_QUALITY_FILTER,
-        env="AWS_REKOGNITION_FACE_DETECT_QUALITY_FILTER",
+        SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_QUALITY_FILTER
     )
     aws_rekognition_face_detect_max_faces_count: Optional[int] = Field(
         SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT,
         gt=0,
-        env="AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT",
-        pre=True,
-        getter=lambda v: empty_str_to_int_default(v, SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT),
     )
     aws_rekognition_face_detect_threshold: Optional[int] = Field(
         SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_THRESHOLD,
         gt=0,
-        env="AWS_REKOGNITION_FACE_DETECT_THRESHOLD",
-        pre=True,
-        getter=lambda v: empty_str_to_int_default(v, SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_THRESHOLD),
-    )
-    langchain_memory_key: Optional[str] = Field(SettingsDefaults.LANGCHAIN_MEMORY_KEY, env="LANGCHAIN_MEMORY_KEY")
-    openai_api_organization: Optional[str] = Field(
-        SettingsDefaults.OPENAI_API_ORGANIZATION, env="OPENAI_API_ORGANIZATION"
-    )
-    openai_api_key: Optional[SecretStr] = Field(SettingsDefaults.OPENAI_API_KEY, env="OPENAI_API_KEY")
-    openai_endpoint_image_n: Optional[int] = Field(
-        SettingsDefaults.OPENAI_ENDPOINT_IMAGE_N, env="OPENAI_ENDPOINT_IMAGE_N"
-    )
-    openai_endpoint_image_size: Optional[str] = Field(
-        SettingsDefaults.OPENAI_ENDPOINT_IMAGE_SIZE, env="OPENAI_ENDPOINT_IMAGE_SIZE"
-    )
-    pinecone_api_key: Optional[SecretStr] = Field(SettingsDefaults.PINECONE_API_KEY, env="PINECONE_API_KEY")
-    shared_resource_identifier: Optional[str] = Field(
-        SettingsDefaults.SHARED_RESOURCE_IDENTIFIER, env="SHARED_RESOURCE_IDENTIFIER"
     )
+    langchain_memory_key: Optional[str] = Field(SettingsDefaults.LANGCHAIN_MEMORY_KEY)
+    openai_api_organization: Optional[str] = Field(SettingsDefaults.OPENAI_API_ORGANIZATION)
+    openai_api_key: Optional[SecretStr] = Field(SettingsDefaults.OPENAI_API_KEY)
+    openai_endpoint_image_n: Optional[int] = Field(SettingsDefaults.OPENAI_ENDPOINT_IMAGE_N)
+    openai_endpoint_image_size: Optional[str] = Field(SettingsDefaults.OPENAI_ENDPOINT_IMAGE_SIZE)
+    pinecone_api_key: Optional[SecretStr] = Field(SettingsDefaults.PINECONE_API_KEY)
+    shared_resource_identifier: Optional[str] = Field(SettingsDefaults.SHARED_RESOURCE_IDENTIFIER)
 
     @property
     def pinecone_api_key_source(self) -> str:
@@ -281,60 +289,46 @@ class Settings(BaseSettings):
     @property
     def aws_session(self):
         """AWS session"""
-        if not self._aws_session:
-            if self.aws_profile:
-                self._aws_session = boto3.Session(profile_name=self.aws_profile, region_name=self.aws_region)
-            else:
-                self._aws_session = boto3.Session(region_name=self.aws_region)
-        return self._aws_session
+        return _get_session(self.aws_profile, self.aws_region)
 
     @property
     def api_client(self):
         """API Gateway client"""
-        if not self._api_client:
-            self._api_client = self.aws_session.client("apigateway")
-        return self._api_client
+        return _get_client("apigateway", self.aws_profile, self.aws_region)
 
     @property
     def s3_client(self):
         """S3 client"""
-        if not self._s3_client:
-            self._s3_client = self.aws_session.client("s3")
-        return self._s3_client
+        return _get_client("s3", self.aws_profile, self.aws_region)
 
     @property
     def dynamodb_client(self):
         """DynamoDB client"""
-        if not self._dynamodb_client:
-            self._dynamodb_client = self.aws_session.client("dynamodb")
-        return self._dynamodb_client
+        return _get_client("dynamodb", self.aws_profile, self.aws_region)
 
     @property
     def rekognition_client(self):
         """Rekognition client"""
-        if not self._rekognition_client:
-            self._rekognition_client = self.aws_session.client("rekognition")
-        return self._rekognition_client
+        return _get_client("rekognition", self.aws_profile, self.aws_region)
 
     @property
     def dynamodb_table(self):
         """DynamoDB table"""
-        if not self._dynamodb_table:
-            self._dynamodb_table = self.dynamodb_client.Table(self.aws_dynamodb_table_id)
-        return self._dynamodb_table
+        return _get_resource("dynamodb", self.aws_profile, self.aws_region).Table(self.aws_dynamodb_table_id)
 
     # use the boto3 library to initialize clients for the AWS services which we'll interact
     @property
     def dump(self) -> dict:
-        """Dump settings to CloudWatch"""
-
-        def recursive_sort_dict(d):
-            return {k: recursive_sort_dict(v) if isinstance(v, dict) else v for k, v in sorted(d.items())}
+        """
+        Dump settings to CloudWatch.
 
-        if self._dump and self._initialized:
+        The dict is not sorted. Callers that need deterministic log output
+        should serialize it with json.dumps(..., sort_keys=True).
+        """
+        if self._dump is not None:
             return self._dump
 
-        self._dump = {
+        dump = {
             "secrets": {
                 "openai_api_source": self.openai_api_key_source,
                 "pinecone_api_source": self.pinecone_api_key_source,
@@ -342,10 +336,10 @@ class Settings(BaseSettings):
             "environment": {
                 "is_using_tfvars_file": self.is_using_tfvars_file,
                 "is_using_dotenv_file": self.is_using_dotenv_file,
-                "os": os.name,
-                "system": platform.system(),
-                "release": platform.release(),
-                "boto3": boto3.__version__,
+                "os": _OS_NAME,
+                "system": _OS_SYSTEM,
+                "release": _OS_RELEASE,
+                "boto3": _BOTO3_VERSION,
                 "shared_resource_identifier": self.shared_resource_identifier,
                 "debug_mode": self.debug_mode,
                 "dump_defaults": self.dump_defaults,
@@ -368,7 +362,7 @@ class Settings(BaseSettings):
         }
         if self.dump_defaults:
             settings_defaults = SettingsDefaults.to_dict()
-            self._dump["settings_defaults"] = settings_defaults
+            dump["settings_defaults"] = settings_defaults
 
         if self.is_using_aws_rekognition:
             aws_rekognition = {
@@ -377,191 +371,81 @@ class Settings(BaseSettings):
                 "aws_rekognition_face_detect_attributes": self.aws_rekognition_face_detect_attributes,
                 "aws_rekognition_face_detect_quality_filter": self.aws_rekognition_face_detect_quality_filter,
             }
-            self._dump["aws_rekognition"] = aws_rekognition
+            dump["aws_rekognition"] = aws_rekognition
 
         if self.is_using_aws_dynamodb:
             aws_dynamodb = {
                 "aws_dynamodb_table_id": self.aws_dynamodb_table_id,
             }
-            self._dump["aws_dynamodb"] = aws_dynamodb
+            dump["aws_dynamodb"] = aws_dynamodb
 
         if self.is_using_dotenv_file:
-            self._dump["environment"]["dotenv"] = self.environment_variables
+            dump["environment"]["dotenv"] = self.environment_variables
 
         if self.is_using_tfvars_file:
-            self._dump["environment"]["tfvars"] = self.tfvars_variables
+            dump["environment"]["tfvars"] = self.tfvars_variables
 
-        self._dump = recursive_sort_dict(self._dump)
+        self._dump = dump
         return self._dump
 
-    # pylint: disable=too-few-public-methods
-    class Config:
-        """Pydantic configuration"""
-
-        frozen = True
-
-    @field_validator("aws_profile")
-    # pylint: disable=no-self-argument,unused-argument
-    def validate_aws_profile(cls, v, values, **kwargs) -> str:
-        """Validate aws_profile"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_PROFILE
-        return v
-
     @field_validator("aws_region")
     # pylint: disable=no-self-argument,unused-argument
     def validate_aws_region(cls, v, values: ValidationInfo, **kwargs) -> str:
         """Validate aws_region"""
-        valid_regions = values.data.get("aws_regions", [])
-        if v in [None, ""]:
+        if v in (None, ""):
             return SettingsDefaults.AWS_REGION
-        if v not in valid_regions:
-            raise OpenAIAPIValueError(f"aws_region {v} not in aws_regions")
+        if v not in _get_valid_regions():
+            raise OpenAIAPIValueError(f"aws_region {v} is not a valid AWS region")
         return v
 
     @field_validator("aws_apigateway_root_domain")
     def validate_aws_apigateway_root_domain(cls, v) -> str:
         """Validate aws_apigateway_root_domain"""
-        if v in [None, ""]:
+        if v in (None, ""):
             v = SettingsDefaults.AWS_APIGATEWAY_ROOT_DOMAIN_NAME
-        if not re.match(SettingsDefaults.VALID_DOMAIN_PATTERN, v):
+        if not _VALID_DOMAIN_RE.match(v):
             raise OpenAIAPIValueError("Invalid root domain name")
         return v
 
     @field_validator("aws_apigateway_custom_domain_name")
     def validate_aws_apigateway_custom_domain_name(cls, v) -> str:
         """Validate aws_apigateway_custom_domain_name"""
-        if v in [None, ""]:
+        if v in (None, ""):
             v = SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE
-        if not re.match(SettingsDefaults.VALID_DOMAIN_PATTERN, v):
+        if not _VALID_DOMAIN_RE.match(v):
             raise OpenAIAPIValueError("Invalid custom domain name")
         return v
 
-    @field_validator("aws_apigateway_custom_domain_name")
-    def validate_aws_apigateway_custom_domain_name_create(cls, v) -> bool:
-        """Validate aws_apigateway_custom_domain_name_create"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE
-        return v
-
-    @field_validator("shared_resource_identifier")
-    def validate_shared_resource_identifier(cls, v) -> str:
-        """Validate shared_resource_identifier"""
-        if v in [None, ""]:
-            return SettingsDefaults.SHARED_RESOURCE_IDENTIFIER
-        return v
-
-    @field_validator("aws_dynamodb_table_id")
-    def validate_table_id(cls, v) -> str:
-        """Validate aws_dynamodb_table_id"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_DYNAMODB_TABLE_ID
-        return v
-
-    @field_validator("aws_rekognition_collection_id")
-    def validate_collection_id(cls, v) -> str:
-        """Validate aws_rekognition_collection_id"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_REKOGNITION_COLLECTION_ID
-        return v
-
-    @field_validator("aws_rekognition_face_detect_attributes")
-    def validate_face_detect_attributes(cls, v) -> str:
-        """Validate aws_rekognition_face_detect_attributes"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_ATTRIBUTES
-        return v
-
     @field_validator("debug_mode")
     def parse_debug_mode(cls, v) -> bool:
         """Parse debug_mode"""
         if isinstance(v, bool):
             return v
-        if v in [None, ""]:
-            return SettingsDefaults.DEBUG_MODE
-        return v.lower() in ["true", "1", "t", "y", "yes"]
+        return empty_str_to_bool_default(v, SettingsDefaults.DEBUG_MODE)
 
     @field_validator("dump_defaults")
     def parse_dump_defaults(cls, v) -> bool:
         """Parse dump_defaults"""
         if isinstance(v, bool):
             return v
-        if v in [None, ""]:
-            return SettingsDefaults.DUMP_DEFAULTS
-        return v.lower() in ["true", "1", "t", "y", "yes"]
-
-    @field_validator("aws_rekognition_face_detect_max_faces_count")
-    def check_face_detect_max_faces_count(cls, v) -> int:
-        """Check aws_rekognition_face_detect_max_faces_count"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT
-        return int(v)
-
-    @field_validator("aws_rekognition_face_detect_threshold")
-    def check_face_detect_threshold(cls, v) -> int:
-        """Check aws_rekognition_face_detect_threshold"""
-        if isinstance(v, int):
-            return v
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_THRESHOLD
-        return int(v)
-
-    @field_validator("aws_rekognition_face_detect_quality_filter")
-    def check_face_detect_quality_filter(cls, v) -> str:
-        """Check aws_rekognition_face_detect_quality_filter"""
-        if v in [None, ""]:
-            return SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_QUALITY_FILTER
-        return v
-
-    @field_validator("langchain_memory_key")
-    def check_langchain_memory_key(cls, v) -> str:
-        """Check langchain_memory_key"""
-        if isinstance(v, int):
-            return v
-        if v in [None, ""]:
-            return SettingsDefaults.LANGCHAIN_MEMORY_KEY
-        return v
+        return empty_str_to_bool_default(v, SettingsDefaults.DUMP_DEFAULTS)
 
-    @field_validator("openai_api_organization")
-    def check_openai_api_organization(cls, v) -> str:
-        """Check openai_api_organization"""
-        if v in [None, ""]:
-            return SettingsDefaults.OPENAI_API_ORGANIZATION
+    @field_validator(*_DEFAULTS_BY_FIELD)
+    def empty_to_default(cls, v, info: ValidationInfo) -> Any:
+        """Replace null and empty values with the field's SettingsDefaults value"""
+        if v in (None, ""):
+            return _DEFAULTS_BY_FIELD[info.field_name]
         return v
 
-    @field_validator("openai_api_key")
-    def check_openai_api_key(cls, v) -> SecretStr:
-        """Check openai_api_key"""
-        if v in [None, ""]:
-            return SettingsDefaults.OPENAI_API_KEY
-        return v
 
-    @field_validator("openai_endpoint_image_n")
-    def check_openai_endpoint_image_n(cls, v) -> int:
-        """Check openai_endpoint_image_n"""
-        if isinstance(v, int):
-            return v
-        if v in [None, ""]:
-            return SettingsDefaults.OPENAI_ENDPOINT_IMAGE_N
-        return int(v)
-
-    @field_validator("openai_endpoint_image_size")
-    def check_openai_endpoint_image_size(cls, v) -> str:
-        """Check openai_endpoint_image_size"""
-        if v in [None, ""]:
-            return SettingsDefaults.OPENAI_ENDPOINT_IMAGE_SIZE
-        return v
-
-    @field_validator("pinecone_api_key")
-    def check_pinecone_api_key(cls, v) -> SecretStr:
-        """Check pinecone_api_key"""
-        if v in [None, ""]:
-            return SettingsDefaults.PINECONE_API_KEY
-        return v
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the shared Settings instance, constructing it on first use."""
+    return Settings()
 
 
 settings = None
 try:
-    settings = Settings()
+    settings = get_settings()
 except (ValidationError, ValueError, OpenAIAPIConfigurationError, OpenAIAPIValueError) as e:
     raise OpenAIAPIConfigurationError("Invalid configuration: " + str(e)) from e
@@ -17,7 +17,7 @@ PYTHON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(os.path.dirname(__
 sys.path.append(PYTHON_ROOT)  # noqa: E402
 
 # our stuff
-from openai_api.common.conf import Settings, SettingsDefaults  # noqa: E402
+from openai_api.common.conf import Settings, SettingsDefaults, get_settings, settings  # noqa: E402
 from openai_api.common.exceptions import OpenAIAPIValueError  # noqa: E402
 
 
@@ -148,6 +148,11 @@ class TestConfiguration(unittest.TestCase):
         with self.assertRaises(OpenAIAPIValueError):
             Settings()
 
+    def test_aws_regions_not_a_field(self):
+        """Test that the list of valid AWS regions is not stored on Settings."""
+
+        self.assertNotIn("aws_regions", Settings.model_fields)
+
     @patch.dict(os.environ, {"AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT": "-1"})
     def test_invalid_max_faces_count(self):
         """Test that Pydantic raises a validation error for environment variable w negative integer values."""
@@ -185,6 +190,29 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(mock_settings.aws_rekognition_face_detect_threshold, 102)
         self.assertEqual(mock_settings.debug_mode, True)
 
+    def test_configure_nulls_with_class_constructor(self):
+        """test that null and empty constructor values fall back to SettingsDefaults"""
+
+        mock_settings = Settings(
+            aws_dynamodb_table_id="",
+            aws_rekognition_face_detect_max_faces_count=None,
+            aws_apigateway_custom_domain_name_create=None,
+            openai_endpoint_image_n=None,
+            shared_resource_identifier=None,
+        )
+
+        self.assertEqual(mock_settings.aws_dynamodb_table_id, SettingsDefaults.AWS_DYNAMODB_TABLE_ID)
+        self.assertEqual(
+            mock_settings.aws_rekognition_face_detect_max_faces_count,
+            SettingsDefaults.AWS_REKOGNITION_FACE_DETECT_MAX_FACES_COUNT,
+        )
+        self.assertEqual(
+            mock_settings.aws_apigateway_custom_domain_name_create,
+            SettingsDefaults.AWS_APIGATEWAY_CUSTOM_DOMAIN_NAME_CREATE,
+        )
+        self.assertEqual(mock_settings.openai_endpoint_image_n, SettingsDefaults.OPENAI_ENDPOINT_IMAGE_N)
+        self.assertEqual(mock_settings.shared_resource_identifier, SettingsDefaults.SHARED_RESOURCE_IDENTIFIER)
+
     def test_configure_neg_int_with_class_constructor(self):
         """test that we cannot set negative int values with the class constructor"""
 
@@ -222,12 +250,34 @@ class TestConfiguration(unittest.TestCase):
         with self.assertRaises(PydanticValidationError):
             mock_settings.face_detect_threshold = 25
 
+    def test_get_settings_singleton(self):
+        """Test that get_settings() returns the same cached instance."""
+
+        self.assertIs(get_settings(), get_settings())
+        self.assertIs(get_settings(), settings)
+
     def test_dump(self):
         """Test that dump is a dict."""
 
         mock_settings = Settings()
         self.assertIsInstance(mock_settings.dump, dict)
 
+    def test_dump_is_cached(self):
+        """Test that dump is only computed once per Settings instance."""
+
+        mock_settings = Settings()
+        self.assertIs(mock_settings.dump, mock_settings.dump)
+
+    def test_settings_defaults_to_dict(self):
+        """Test that SettingsDefaults.to_dict() contains only default values."""
+
+        defaults = SettingsDefaults.to_dict()
+        self.assertIs(defaults, SettingsDefaults.to_dict())
+        self.assertEqual(defaults["AWS_REGION"], SettingsDefaults.AWS_REGION)
+        self.assertNotIn("to_dict", defaults)
+        for value in defaults.values():
+            self.assertFalse(callable(value))
+
     def test_dump_keys(self):
         """Test that dump contains the expected keys."""
 